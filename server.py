@@ -1,27 +1,45 @@
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from dotenv import load_dotenv
-import yaml
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.server import Context
+from starlette.requests import Request
+from starlette.responses import Response
 
-# Local modules
-from tools.reddit_analyzer import RedditAnalyzer
-from tools.report_generator import ReportGenerator
-from tools.trends_searcher import TrendsSearcher
-from tools.freelance_analyzer import FreelanceAnalyzer
+# Local modules (tool modules are imported lazily inside the tools: they pull in
+# praw, pytrends, bs4, matplotlib, ... which would otherwise dominate startup)
 from utils.cache_manager import CacheManager
 from utils.data_processor import DataProcessor
-from utils.api_clients import get_reddit_client
+
+if TYPE_CHECKING:  # pragma: no cover
+    from tools.reddit_analyzer import RedditAnalyzer
+    from tools.report_generator import ReportGenerator
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
 
 # -------------------------
 # Bootstrap & configuration
@@ -48,27 +66,229 @@ logger = logging.getLogger("it-trends-mcp-server")
 START_TIME = time.time()
 
 
+@functools.lru_cache(maxsize=4)
 def load_config(path: Path) -> Dict[str, Any]:
+    """Load config.yaml, preferring a parsed JSON sidecar when it is up to date.
+
+    The sidecar (``config.yaml.cache.json``) is rewritten whenever the YAML file is newer.
+    Results are memoized per path; treat the returned dict as read-only.
+    """
     if not path.exists():
         logger.warning("Config file not found at %s, using defaults", path)
         return {}
+    cache_path = path.with_suffix(".yaml.cache.json")
+    try:
+        if cache_path.exists() and cache_path.stat().st_mtime >= path.stat().st_mtime:
+            return json.loads(cache_path.read_bytes())
+    except Exception as e:
+        logger.warning("Ignoring unreadable config cache %s: %s", cache_path, e)
+
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as _SafeLoader  # libyaml-backed, much faster
+    except ImportError:  # pragma: no cover - PyYAML built without libyaml
+        from yaml import SafeLoader as _SafeLoader  # type: ignore
+
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        cfg = yaml.load(f, Loader=_SafeLoader) or {}
+
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(cfg), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+        tmp_path.unlink(missing_ok=True)
+    return cfg
+
+
+@dataclass(frozen=True)
+class Config:
+    """Read-only, flattened view of the settings tools read on every call."""
+
+    cache: Dict[str, Any]
+    cache_ttl: int
+    ttls: Dict[str, int]
+    reddit: Dict[str, Any]
+    analysis: Dict[str, Any]
+    top_n: int
+    freelance_concurrency: int
+    reddit_concurrency: int
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "Config":
+        cache_cfg = raw.get("cache", {"enabled": True, "ttl": 3600, "storage": "file", "redis_url": os.getenv("REDIS_URL")})
+        analysis = raw.get("analysis", {})
+        return cls(
+            cache=cache_cfg,
+            cache_ttl=int(cache_cfg.get("ttl", 3600)),
+            ttls={name: int(v) for name, v in (cache_cfg.get("ttls") or {}).items()},
+            reddit=raw.get("data_sources", {}).get("reddit", {}),
+            analysis=analysis,
+            top_n=int(analysis.get("top_n_results", 20) or 20),
+            freelance_concurrency=int(raw.get("concurrency", {}).get("freelance", 4)),
+            reddit_concurrency=int(raw.get("concurrency", {}).get("reddit", 4)),
+        )
+
+    def ttl(self, name: str) -> int:
+        """Per-source TTL from cache.ttls, falling back to the global cache.ttl."""
+        return self.ttls.get(name, self.cache_ttl)
 
 
 CONFIG = load_config(CONFIG_PATH)
+CFG = Config.from_dict(CONFIG)
 
-# Initialize helpers
-cache_cfg = CONFIG.get("cache", {"enabled": True, "ttl": 3600, "storage": "file", "redis_url": os.getenv("REDIS_URL")})
-cache = CacheManager(cache_cfg, default_dir=str(CACHE_DIR))
 
-data_processor = DataProcessor(CONFIG.get("analysis", {}))
+def _cache_key(domain: str, day: str, params: Dict[str, Any]) -> str:
+    """Build a compact `{domain}:{day}:{digest}` key from already-normalized params."""
+    if orjson is not None:
+        payload = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    else:
+        # same bytes as orjson for str/int params, so keys don't depend on the codec
+        payload = json.dumps(params, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return f"{domain}:{day}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+
+_TODAY_CACHE: Dict[str, Any] = {"date": "", "next_refresh": 0.0}
+
+
+def _utc_today() -> str:
+    """Today's UTC date (YYYY-MM-DD), recomputed only when the UTC day rolls over."""
+    now = time.time()
+    if now >= _TODAY_CACHE["next_refresh"]:
+        _TODAY_CACHE["date"] = datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%d")
+        _TODAY_CACHE["next_refresh"] = now - now % 86400 + 86400  # next UTC midnight
+    return _TODAY_CACHE["date"]
+
+
+# Tool argument schemas, compiled once per tool on first use (fastjsonschema)
+_STR_LIST: Dict[str, Any] = {"type": "array", "items": {"type": "string"}}
+_TOOL_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "analyze_reddit": {
+        "type": "object",
+        "properties": {
+            "subreddits": _STR_LIST,
+            "lookback_days": {"type": "integer", "minimum": 1},
+            "keywords": _STR_LIST,
+        },
+        "required": ["subreddits", "lookback_days", "keywords"],
+    },
+    "analyze_freelance": {
+        "type": "object",
+        "properties": {
+            "platforms": _STR_LIST,
+            "categories": {"anyOf": [{"type": "null"}, _STR_LIST]},
+        },
+        "required": ["platforms"],
+    },
+    "search_trends": {
+        "type": "object",
+        "properties": {"keywords": _STR_LIST},
+        "required": ["keywords"],
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_validator(tool: str) -> Optional[Callable[[Any], Any]]:
+    try:
+        import fastjsonschema  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return fastjsonschema.compile(_TOOL_SCHEMAS[tool])
+
+
+def _check_list_of_str(obj: Any, name: str, suffix: str = "") -> None:
+    # any() stops at the first non-str element
+    if not isinstance(obj, list) or any(not isinstance(x, str) for x in obj):
+        raise ValueError(f"{name} must be a list[str]{suffix}")
+
+
+def _validate_args_fallback(tool: str, args: Dict[str, Any]) -> None:
+    """Plain-Python checks for the subset of JSON Schema used in _TOOL_SCHEMAS,
+    raising the per-field messages the tools have always used."""
+    for name, prop in _TOOL_SCHEMAS[tool]["properties"].items():
+        value = args.get(name)
+        suffix = ""
+        if "anyOf" in prop:
+            if value is None:
+                continue
+            prop, suffix = prop["anyOf"][-1], " if provided"
+        if prop["type"] == "array":
+            _check_list_of_str(value, name, suffix)
+        elif prop["type"] == "integer":
+            # bool is an int subclass, but not a JSON Schema integer
+            if not isinstance(value, int) or isinstance(value, bool) or value < prop.get("minimum", value):
+                raise ValueError(f"{name} must be a positive int")
+
+
+def _validate_args(tool: str, args: Dict[str, Any]) -> None:
+    validator = _schema_validator(tool)
+    if validator is None:
+        _validate_args_fallback(tool, args)
+        return
+    try:
+        validator(args)
+    except ValueError:  # fastjsonschema.JsonSchemaException subclasses ValueError
+        # rejections are rare: re-check in Python for the per-field message instead
+        # of surfacing fastjsonschema's "data.<field> must be ..." wording
+        _validate_args_fallback(tool, args)
+        raise ValueError(f"invalid arguments for {tool}") from None
+
+
+# Initialize helpers
+cache = CacheManager(CFG.cache, default_dir=str(CACHE_DIR))
+
+data_processor = DataProcessor(CFG.analysis)
+
+# Supported freelance platforms; every valid selection maps to its interned, sorted key string
+_FREELANCE_PLATFORMS = frozenset({"upwork", "freelancer"})
+_FREELANCE_KEYS: Dict[frozenset, str] = {
+    frozenset({"upwork"}): "upwork",
+    frozenset({"freelancer"}): "freelancer",
+    frozenset({"upwork", "freelancer"}): "freelancer,upwork",
+}
+
+# Cap concurrent scrapes against freelance sites (avoids remote rate limits)
+FREELANCE_SEM = asyncio.Semaphore(CFG.freelance_concurrency)
+
+# Init clients and analyzers lazily when used; built once and reused across calls
+_reddit_analyzer: Optional["RedditAnalyzer"] = None
+_report_generator: Optional["ReportGenerator"] = None
+_init_lock = asyncio.Lock()
+
+
+async def _get_reddit_analyzer() -> "RedditAnalyzer":
+    global _reddit_analyzer
+    if _reddit_analyzer is None:
+        async with _init_lock:
+            if _reddit_analyzer is None:
+                from tools.reddit_analyzer import RedditAnalyzer
+                from utils.api_clients import get_reddit_client
+
+                reddit_client = await asyncio.to_thread(get_reddit_client, CFG.reddit)
+                _reddit_analyzer = RedditAnalyzer(
+                    reddit_client=reddit_client, logger=logger, cache=cache, max_concurrent=CFG.reddit_concurrency
+                )
+    return _reddit_analyzer
+
+
+def _get_report_generator() -> "ReportGenerator":
+    # no await between the check and the assignment, so no lock is needed
+    global _report_generator
+    if _report_generator is None:
+        from tools.report_generator import ReportGenerator
+
+        _report_generator = ReportGenerator(
+            output_dir=str(REPORTS_DIR), templates_dir=str(TEMPLATES_DIR), logger=logger
+        )
+    return _report_generator
 
-# Init clients and analyzers lazily when used
 
 server_meta = CONFIG.get("server", {"name": "IT Trends MCP Server", "version": "1.0.0"})
 
-# Optionally start lightweight HTTP health server
+# Bind address of the streamable HTTP transport (also serves /healthz)
 try:
     srv_cfg = CONFIG.get("server", {})
     http_host = srv_cfg.get("host", "localhost")
@@ -76,20 +296,24 @@ try:
 except Exception:
     http_host, http_port = "localhost", 0
 
-# Log startup to stderr (safe for MCP stdio) so users see confirmation on launch
-try:
-    pid = os.getpid()
-except Exception:
-    pid = None
-logger.info(
-    "MCP server successfully started | name=%s version=%s transport=stdio pid=%s",
-    server_meta.get("name"),
-    server_meta.get("version"),
-    pid
-)
-
 server = FastMCP(server_meta.get("name", "IT Trends MCP Server"), host=http_host, port=http_port, streamable_http_path="/")
 
+# Static part of the /healthz payload, serialized once (without the closing brace)
+_HEALTH_PREFIX = _dumps({
+    "status": "ok",
+    "name": server_meta.get("name"),
+    "version": server_meta.get("version"),
+})[:-1]
+
+
+@server.custom_route("/healthz", methods=["GET"])
+async def healthz(request: Request) -> Response:
+    """Liveness probe served on the MCP event loop; only time and uptime are formatted per call."""
+    now = time.time()
+    iso = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    body = _HEALTH_PREFIX + f',"time":"{iso}","uptime_seconds":{now - START_TIME:.3f}}}'.encode("utf-8")
+    return Response(body, media_type="application/json")
+
 
 # -------------------------
 # Prompts
@@ -116,38 +340,40 @@ def forecast_prompt() -> str:
 # Resources
 # -------------------------
 @server.resource("cache://trends/{date}")
-def read_cached_trends(date: str) -> bytes:
-    """Expose cached daily trends as an MCP resource.
+async def read_cached_trends(date: str) -> bytes:
+    """Expose cached daily trends as an MCP resource: the most recently requested
+    search_trends result of that day.
 
     Example URI: cache://trends/2025-10-21
     """
     logger.info("resource access: cache://trends/%s", date)
     key = f"trends:{date}"
-    data = cache.get(key)
+    # cache backends do blocking file/Redis I/O; keep it off the event loop
+    data = await asyncio.to_thread(cache.get, key)
     if data is None:
-        return json.dumps({"error": "not_found", "key": key}).encode("utf-8")
-    return json.dumps(data).encode("utf-8")
+        return _dumps({"error": "not_found", "key": key})
+    return _dumps(data)
 
 
 @server.resource("history://technology/{name}")
-def read_technology_history(name: str) -> bytes:
+async def read_technology_history(name: str) -> bytes:
     """Expose historical data for a technology from local DB/file as MCP resource.
     For now, returns a stub that looks into cache first and then the data directory.
     """
     logger.info("resource access: history://technology/%s", name)
     # First try cache
-    cached = cache.get(f"history:{name}")
+    cached = await asyncio.to_thread(cache.get, f"history:{name}")
     if cached is not None:
-        return json.dumps(cached).encode("utf-8")
+        return _dumps(cached)
 
     # Then try file fallback
     file_path = DATA_DIR / f"history_{name}.json"
     if file_path.exists():
         try:
-            return file_path.read_bytes()
+            return await asyncio.to_thread(file_path.read_bytes)
         except Exception as e:
             logger.error("Failed reading history file %s: %s", file_path, e)
-    return json.dumps({"technology": name, "history": [], "note": "no data"}).encode("utf-8")
+    return _dumps({"technology": name, "history": [], "note": "no data"})
 
 
 # -------------------------
@@ -178,26 +404,27 @@ async def analyze_reddit(subreddits: List[str], lookback_days: int, keywords: Li
     )
 
     # validate
-    if not isinstance(subreddits, list) or not all(isinstance(s, str) for s in subreddits):
-        raise ValueError("subreddits must be a list[str]")
-    if not isinstance(lookback_days, int) or lookback_days <= 0:
-        raise ValueError("lookback_days must be a positive int")
-    if not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords):
-        raise ValueError("keywords must be a list[str]")
-
-    reddit_cfg = CONFIG.get("data_sources", {}).get("reddit", {})
-    # Build analyzer lazily
-    reddit_client = await asyncio.to_thread(get_reddit_client, reddit_cfg)
-    analyzer = RedditAnalyzer(reddit_client=reddit_client, logger=logger, cache=cache)
+    _validate_args(
+        "analyze_reddit",
+        {"subreddits": subreddits, "lookback_days": lookback_days, "keywords": keywords},
+    )
+
+    # normalize keywords once: used for the cache key and by the analyzer
+    kw_norm = sorted({k.strip().lower() for k in keywords if k.strip()})
+
+    analyzer = await _get_reddit_analyzer()
 
     # caching key
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    cache_key = f"reddit:{today}:{','.join(sorted(subreddits))}:{lookback_days}:{','.join(sorted([k.lower() for k in keywords]))}"
+    today = _utc_today()
+    cache_key = _cache_key("reddit", today, {"sr": sorted(subreddits), "lb": lookback_days, "kw": kw_norm})
 
     async def fetch() -> Dict[str, Any]:
         posts = await analyzer.fetch_posts(subreddits=subreddits, lookback_days=lookback_days)
-        technologies = await analyzer.extract_technologies(posts=posts, keywords=keywords)
-        sentiment = await analyzer.calculate_sentiment(posts=posts, keywords=keywords)
+        lowered = analyzer.prepare_posts(posts)
+        technologies, sentiment = await asyncio.gather(
+            analyzer.extract_technologies(posts=posts, keywords=kw_norm, lowered=lowered),
+            analyzer.calculate_sentiment(posts=posts, keywords=kw_norm, lowered=lowered),
+        )
         ranked = await analyzer.rank_by_popularity(technologies)
 
         result = {
@@ -213,7 +440,7 @@ async def analyze_reddit(subreddits: List[str], lookback_days: int, keywords: Li
         }
         return result
 
-    result = await cache.get_or_fetch_async(cache_key, fetch, ttl=CONFIG.get("cache", {}).get("ttl", 3600))
+    result = await cache.get_or_fetch_async(cache_key, fetch, ttl=CFG.ttl("reddit"))
     elapsed = time.perf_counter() - start_ts
     logger.info(
         "analyze_reddit finished | client_id=%s request_id=%s | posts=%s unique_tech=%s | duration=%.3fs",
@@ -257,9 +484,10 @@ async def generate_report(data: Dict[str, Any], format: str = "html", include_ch
     if fmt not in {"pdf", "excel", "html"}:
         raise ValueError("format must be one of: pdf, excel, html")
 
-    generator = ReportGenerator(output_dir=str(REPORTS_DIR), templates_dir=str(TEMPLATES_DIR), logger=logger)
+    generator = _get_report_generator()
     charts = None
-    if include_charts:
+    # Excel output does not embed charts; skip rendering them
+    if include_charts and fmt in ("html", "pdf"):
         charts = await generator.create_visualizations(data)
 
     if fmt == "html":
@@ -301,52 +529,62 @@ async def analyze_freelance(platforms: List[str], categories: Optional[List[str]
         categories,
     )
 
-    if not isinstance(platforms, list) or not all(isinstance(p, str) for p in platforms):
-        raise ValueError("platforms must be a list[str]")
+    _validate_args("analyze_freelance", {"platforms": platforms, "categories": categories})
     categories_lc: Optional[List[str]] = None
     if categories is not None:
-        if not isinstance(categories, list) or not all(isinstance(c, str) for c in categories):
-            raise ValueError("categories must be a list[str] if provided")
         categories_lc = [c.strip().lower() for c in categories if isinstance(c, str) and c.strip()]
 
-    normalized = {p.strip().lower() for p in platforms if p and isinstance(p, str)}
+    normalized = frozenset(p.strip().lower() for p in platforms if p)
     if not normalized or "all" in normalized:
-        normalized = {"upwork", "freelancer"}
-    valid = {"upwork", "freelancer"}
-    chosen = sorted(list(normalized & valid))
-    if not chosen:
+        normalized = _FREELANCE_PLATFORMS
+    chosen_str = _FREELANCE_KEYS.get(normalized & _FREELANCE_PLATFORMS)
+    if chosen_str is None:
         raise ValueError("platforms must include at least one of: upwork, freelancer, all")
+    chosen = chosen_str.split(",")
 
     # caching key (per-day)
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    cache_key = f"freelance:{today}:{','.join(chosen)}:{','.join(categories_lc or [])}"
+    today = _utc_today()
+    cache_key = _cache_key("freelance", today, {"pl": chosen_str, "cat": categories_lc or []})
+
+    from tools.freelance_analyzer import FreelanceAnalyzer
 
     async def fetch() -> Dict[str, Any]:
-        analyzer = FreelanceAnalyzer(logger=logger)
+        analyzer = FreelanceAnalyzer(logger=logger, cache=cache)
         tasks = []
         if "upwork" in chosen:
             tasks.append(analyzer.scrape_upwork())
         if "freelancer" in chosen:
             tasks.append(analyzer.scrape_freelancer())
-        results = await asyncio.gather(*tasks) if tasks else []
+
+        async def _guarded(coro):
+            async with FREELANCE_SEM:
+                return await coro
+
+        results = await asyncio.gather(*[_guarded(t) for t in tasks]) if tasks else []
         jobs = []
         for r in results:
             jobs.extend(r or [])
 
         # optional filtering by categories (keyword contains in title/skills)
         if categories_lc:
+            category_re = re.compile("|".join(map(re.escape, categories_lc)))
+
             def _match(job: Dict[str, Any]) -> bool:
-                text = (str(job.get("title") or "") + " " + str(job.get("description") or "")).lower()
-                skills = [str(s).lower() for s in (job.get("skills") or [])]
-                return any((kw in text) or any(kw in s for s in skills) for kw in categories_lc or [])
+                # newline-joined so a category cannot match across two fields
+                hay = "\n".join(
+                    [str(job.get("title") or ""), str(job.get("description") or "")]
+                    + [str(s) for s in (job.get("skills") or [])]
+                ).lower()
+                return category_re.search(hay) is not None
+
             jobs = [j for j in jobs if _match(j)]
 
         skills = await analyzer.parse_job_requirements(jobs)
         avg_rate = await analyzer.calculate_avg_rates(jobs)
+        # ties broken by name: skill extraction yields unordered sets
         ranked = sorted(
             ({"technology": k, "mentions": float(v)} for k, v in skills.items()),
-            key=lambda x: x["mentions"],
-            reverse=True,
+            key=lambda x: (-x["mentions"], x["technology"]),
         )
         status = "ok" if ranked else "not_available"
         if ranked and avg_rate == 0.0:
@@ -361,13 +599,13 @@ async def analyze_freelance(platforms: List[str], categories: Optional[List[str]
             "status": status,
         }
 
-    result = await cache.get_or_fetch_async(cache_key, fetch, ttl=CONFIG.get("cache", {}).get("ttl", 3600))
+    result = await cache.get_or_fetch_async(cache_key, fetch, ttl=CFG.ttl("freelance"))
     elapsed = time.perf_counter() - start_ts
     logger.info(
         "analyze_freelance finished | client_id=%s request_id=%s | platforms=%s jobs=%s skills=%s | duration=%.3fs",
         client_id,
         request_id,
-        ",".join(chosen),
+        chosen_str,
         result.get("stats", {}).get("jobs_count"),
         result.get("stats", {}).get("unique_skill_count"),
         elapsed,
@@ -396,15 +634,16 @@ async def search_trends(keywords: List[str], timeframe: str = "now 7-d", region:
         region,
     )
 
-    if not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords):
-        raise ValueError("keywords must be a list[str]")
+    _validate_args("search_trends", {"keywords": keywords})
     tf = str(timeframe or "now 7-d")
     reg = str(region or "US")
 
     # caching key (per-day)
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    kw_norm = [k.strip().lower() for k in keywords if isinstance(k, str) and k.strip()]
-    cache_key = f"trends:{today}:{','.join(sorted(kw_norm))}:{tf}:{reg}"
+    today = _utc_today()
+    kw_norm = sorted({k.strip().lower() for k in keywords if k.strip()})
+    cache_key = _cache_key("trends", today, {"kw": kw_norm, "tf": tf, "reg": reg})
+
+    from tools.trends_searcher import TrendsSearcher
 
     async def fetch() -> Dict[str, Any]:
         searcher = TrendsSearcher(logger=logger)
@@ -425,7 +664,11 @@ async def search_trends(keywords: List[str], timeframe: str = "now 7-d", region:
             "top_technologies": combined.get("top_technologies", []),
         }
 
-    result = await cache.get_or_fetch_async(cache_key, fetch, ttl=CONFIG.get("cache", {}).get("ttl", 3600))
+    # also exposed as the per-day cache resource (cache://trends/{date}), which
+    # follows the most recent search on hits as well as misses
+    result = await cache.get_or_fetch_async(
+        cache_key, fetch, ttl=CFG.ttl("trends"), alias_keys=[f"trends:{today}"]
+    )
     elapsed = time.perf_counter() - start_ts
     logger.info(
         "search_trends finished | client_id=%s request_id=%s | keywords=%s unique_tech=%s | duration=%.3fs",
@@ -435,8 +678,6 @@ async def search_trends(keywords: List[str], timeframe: str = "now 7-d", region:
         len(result.get("top_technologies", []) or []),
         elapsed,
     )
-    # also store per-day cache resource
-    cache.set(f"trends:{today}", result, ttl=CONFIG.get("cache", {}).get("ttl", 3600))
     return result
 
 
@@ -481,9 +722,11 @@ async def analyze_trends(
     use_trends = bool(src.get("trends", True))
     # Note: reddit/freelance are currently hints; this tool focuses on trends aggregation for minimal latency.
 
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    today = _utc_today()
     cache_key = f"analyze:{today}:{days}:{int(use_trends)}:{language}"
 
+    from tools.trends_searcher import TrendsSearcher
+
     async def fetch() -> Dict[str, Any]:
         searcher = TrendsSearcher(logger=logger)
         google: Dict[str, Any] = {"top_technologies": []}
@@ -497,10 +740,10 @@ async def analyze_trends(
                 searcher.search_github_trends(),
                 searcher.search_stackoverflow(),
             )
-            combined = await searcher.aggregate_results([google, github, stackoverflow])
+            combined = await searcher.aggregate_results([google, github, stackoverflow], top_k=CFG.top_n)
 
         # Prepare outputs as simple string lists
-        top_n = int(CONFIG.get("analysis", {}).get("top_n_results", 20) or 20)
+        top_n = CFG.top_n
         def _names(items: List[Dict[str, Any]]) -> List[str]:
             return [str(i.get("technology") or "").strip() for i in items if str(i.get("technology") or "").strip()]
 
@@ -521,7 +764,7 @@ async def analyze_trends(
             "summary": summary,
         }
 
-    result = await cache.get_or_fetch_async(cache_key, fetch, ttl=CONFIG.get("cache", {}).get("ttl", 1800))
+    result = await cache.get_or_fetch_async(cache_key, fetch, ttl=CFG.ttl("trends"))
     elapsed = time.perf_counter() - start_ts
     logger.info(
         "analyze_trends finished | client_id=%s request_id=%s | top_trends=%s | duration=%.3fs",
@@ -539,7 +782,36 @@ async def get_historical_comparison(technology: str, days_back: int = 30) -> Dic
     return {"status": "not_implemented", "message": "Historical comparison will be added in a future version."}
 
 
+async def _serve() -> None:
+    # asyncio.to_thread() runs on the default executor; the stock min(32, cpu + 4)
+    # workers is too small for blocking Reddit/scraper calls under parallel sessions
+    pool_size = int(os.getenv("THREAD_POOL_SIZE", "64"))
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="mcp-io")
+    )
+    await server.run_streamable_http_async()
+
+
 if __name__ == "__main__":
+    # Logged here rather than at import: report worker processes re-import this
+    # script as __mp_main__ and must not announce a server start
+    # (to stderr, which is safe for MCP stdio)
+    logger.info(
+        "MCP server successfully started | name=%s version=%s transport=stdio pid=%s",
+        server_meta.get("name"),
+        server_meta.get("version"),
+        os.getpid(),
+    )
 
-    # Run MCP server (stdio by default)
-    server.run(transport="streamable-http")
+    try:
+        import uvloop  # type: ignore
+    except ImportError:  # pragma: no cover - not available on Windows
+        uvloop = None
+
+    # Run MCP server (streamable HTTP; equivalent to server.run(transport="streamable-http")),
+    # on uvloop when installed. uvloop.run() replaces uvloop.install(), which swaps the
+    # global event loop policy and is deprecated on Python 3.12+
+    if uvloop is not None:
+        uvloop.run(_serve())
+    else:
+        asyncio.run(_serve())
@@ -1,6 +1,86 @@
 import asyncio
+import functools
 import re
-from typing import Any, Dict, List, Optional, Set
+import statistics
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set
+
+# Hourly rate patterns ($25/hr, $40 per hour, 30 USD/hour) combined into one scan;
+# exactly one of the groups is set on a match.
+_RATE_RE = re.compile(
+    r"\$\s*(\d+(?:[.,]\d{1,2})?)\s*/\s*hr"
+    r"|\$\s*(\d+(?:[.,]\d{1,2})?)\s*(?:per|/)?\s*hour"
+    r"|(\d+(?:[.,]\d{1,2})?)\s*(?:usd|eur|gbp)?\s*/\s*hour",
+    re.IGNORECASE,
+)
+
+# Small built-in skill vocabulary used for text extraction (avoids external deps)
+_SKILL_VOCAB: FrozenSet[str] = frozenset({
+    # languages
+    "python","java","javascript","typescript","c#","c++","go","golang","rust","php","ruby","swift","kotlin",
+    # frameworks
+    ".net","asp.net","spring","django","flask","rails","laravel","react","vue","angular","next.js","nuxt","svelte",
+    # data / ml
+    "sql","postgres","mysql","mongodb","redis","hadoop","spark","pandas","numpy","tensorflow","pytorch","scikit-learn",
+    # devops / cloud
+    "aws","azure","gcp","docker","kubernetes","terraform","ansible","jenkins","ci/cd","gitlab","github actions",
+    # web / cms / commerce
+    "wordpress","shopify","woocommerce","magento","drupal",
+    # blockchain
+    "solidity","web3",
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _skill_automaton() -> Optional[Any]:
+    """Aho-Corasick automaton over _SKILL_VOCAB, built once; None if pyahocorasick is missing."""
+    try:
+        import ahocorasick  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in _SKILL_VOCAB:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.lru_cache(maxsize=None)
+def _html_parser() -> str:
+    """BeautifulSoup parser name: the lxml C parser when installed, else the stdlib one."""
+    try:
+        import lxml  # type: ignore  # noqa: F401
+    except Exception:  # pragma: no cover - optional dependency
+        return "html.parser"
+    return "lxml"
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_skill(s: Optional[str]) -> str:
+    # memoized: scraped pages repeat the same labels (nav links, tags) many times
+    return (s or "").strip().lower()
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+_HTTP: Optional[Any] = None
+
+
+def _http_client() -> Any:
+    """Process-wide pooled httpx.AsyncClient (HTTP/2 when the h2 extra is installed)."""
+    global _HTTP
+    if _HTTP is None:
+        import httpx  # type: ignore
+
+        try:
+            _HTTP = httpx.AsyncClient(http2=True, timeout=15, headers=DEFAULT_HEADERS, follow_redirects=True)
+        except ImportError:  # pragma: no cover - h2 not installed
+            _HTTP = httpx.AsyncClient(timeout=15, headers=DEFAULT_HEADERS, follow_redirects=True)
+    return _HTTP
 
 
 class FreelanceAnalyzer:
@@ -10,12 +90,18 @@ class FreelanceAnalyzer:
 
     Goals:
     - Provide best-effort signals from public, non-auth pages (no credentials).
-    - Run blocking I/O in threads; never crash on missing deps or network.
+    - Fetch pages with a shared async HTTP client and parse them in threads;
+      never crash on missing deps or network.
     - Normalize output to align with other analyzers: top_technologies + stats.
     """
 
-    def __init__(self, logger) -> None:
+    # scraped pages change at most daily
+    SCRAPE_TTL = 86400
+
+    def __init__(self, logger, cache: Optional[Any] = None) -> None:
         self.logger = logger
+        # optional CacheManager; scraper results are memoized per source and UTC day
+        self.cache = cache
 
     # -----------------
     # Helper utilities
@@ -23,217 +109,218 @@ class FreelanceAnalyzer:
     async def _to_thread(self, func, *args, **kwargs):
         return await asyncio.to_thread(func, *args, **kwargs)
 
-    def _normalize_skill(self, s: Optional[str]) -> str:
-        return (s or "").strip().lower()
-
     def _extract_rate_from_text(self, text: Optional[str]) -> Optional[float]:
         """Extract an hourly rate like $25/hr, $40 per hour, 30 USD/hour.
         Returns first matched numeric value as float or None.
         """
         if not text:
             return None
-        t = str(text)
-        # Common patterns
-        patterns = [
-            r"\$\s*(\d+(?:[.,]\d{1,2})?)\s*/\s*hr",
-            r"\$\s*(\d+(?:[.,]\d{1,2})?)\s*(?:per|/)?\s*hour",
-            r"(\d+(?:[.,]\d{1,2})?)\s*(?:usd|eur|gbp)?\s*/\s*hour",
-        ]
-        for p in patterns:
-            m = re.search(p, t, re.IGNORECASE)
-            if m:
-                try:
-                    return float(m.group(1).replace(",", "."))
-                except Exception:
-                    continue
-        return None
+        m = _RATE_RE.search(str(text))
+        if not m:
+            return None
+        value = next(g for g in m.groups() if g is not None)
+        try:
+            return float(value.replace(",", "."))
+        except Exception:
+            return None
 
-    def _extract_skills_from_text(self, text: Optional[str]) -> List[str]:
+    def _extract_skills_from_text(self, text: Optional[str]) -> Set[str]:
         """Very simple keyword-based skill extraction from text.
         Uses a small built-in vocabulary to avoid external deps.
+        Returns an unordered set; callers that rank results sort them.
         """
         if not text:
-            return []
-        vocab: Set[str] = {
-            # languages
-            "python","java","javascript","typescript","c#","c++","go","golang","rust","php","ruby","swift","kotlin",
-            # frameworks
-            ".net","asp.net","spring","django","flask","rails","laravel","react","vue","angular","next.js","nuxt","svelte",
-            # data / ml
-            "sql","postgres","mysql","mongodb","redis","hadoop","spark","pandas","numpy","tensorflow","pytorch","scikit-learn",
-            # devops / cloud
-            "aws","azure","gcp","docker","kubernetes","terraform","ansible","jenkins","ci/cd","gitlab","github actions",
-            # web / cms / commerce
-            "wordpress","shopify","woocommerce","magento","drupal",
-            # blockchain
-            "solidity","web3",
-        }
+            return set()
         t = text.lower()
-        found = {kw for kw in vocab if kw and kw in t}
-        return sorted(found)
+        automaton = _skill_automaton()
+        if automaton is not None:
+            # one pass over the text reports every vocabulary hit (same as `kw in t`)
+            found = {kw for _, kw in automaton.iter(t)}
+        else:
+            found = {kw for kw in _SKILL_VOCAB if kw in t}
+        return found
 
     # -----------------------------
     # Scrapers (best-effort, safe)
     # -----------------------------
+    async def _scrape_first(
+        self,
+        client: Any,
+        urls: List[str],
+        parse: Callable[[bytes], List[Dict[str, Any]]],
+        label: str,
+    ) -> List[Dict[str, Any]]:  # pragma: no cover - network dependent
+        """Request all alternative urls concurrently and return the items of the
+        first page that parses to a non-empty result; the remaining requests are cancelled.
+        Non-empty results are cached for the UTC day when a cache is configured.
+        """
+        cache_key = None
+        if self.cache is not None:
+            today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            cache_key = f"freelance:{label.lower()}:{today}"
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        async def _load(url: str) -> List[Dict[str, Any]]:
+            try:
+                resp = await client.get(url)
+                if resp.status_code != 200 or not resp.content:
+                    return []
+                # parsing is CPU-bound; keep it off the event loop
+                return await self._to_thread(parse, resp.content)
+            except Exception as e:  # pragma: no cover - network dependent
+                self.logger.warning("%s scrape failed for %s: %s", label, url, e)
+                return []
+
+        tasks = [asyncio.create_task(_load(u)) for u in urls]
+        items: List[Dict[str, Any]] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                items = await next_done
+                if items:
+                    break
+        finally:
+            for t in tasks:
+                t.cancel()
+        # empty means every url failed; don't pin that for the whole day
+        if items and cache_key is not None:
+            self.cache.set(cache_key, items, ttl=self.SCRAPE_TTL)
+        return items
+
     async def scrape_upwork(self) -> List[Dict[str, Any]]:  # pragma: no cover - network dependent
         """Scrape a public Upwork resource page listing in-demand skills.
         No authentication; returns job-like items with skills only.
         """
         try:
-            import requests  # type: ignore
-            from bs4 import BeautifulSoup  # type: ignore
+            from bs4 import BeautifulSoup, NavigableString  # type: ignore
+            client = _http_client()
         except Exception as e:  # pragma: no cover - environment dependent
             self.logger.warning("Upwork scraper unavailable (deps missing): %s", e)
             return []
 
-        def _fetch() -> List[Dict[str, Any]]:
-            urls = [
-                "https://www.upwork.com/resources/most-in-demand-tech-skills",
-                "https://www.upwork.com/resources/most-in-demand-skills",
-            ]
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            }
+        def _parse(content: bytes) -> List[Dict[str, Any]]:
+            soup = BeautifulSoup(content, _html_parser())
+            # Short skill-like texts: list items (<= 4 words / 40 chars), with
+            # headings/spans/links as a stricter fallback (<= 3 words / 30 chars).
+            # One DOM pass; list items come first as before.
+            li_candidates: List[str] = []
+            other_candidates: List[str] = []
+            for el in soup.select("li, h2, h3, span, a"):
+                is_li = el.name == "li"
+                max_len, max_words = (40, 4) if is_li else (30, 3)
+                # .string is a cheap attribute for single-text nodes; get_text() walks the subtree.
+                # Only plain text takes the shortcut: .string may also be a Comment/CData,
+                # which get_text() leaves out
+                txt = el.string
+                txt = (txt if type(txt) is NavigableString else el.get_text(" ") or "").strip()
+                if not 2 <= len(txt) <= max_len or len(txt.split()) > max_words:
+                    continue
+                (li_candidates if is_li else other_candidates).append(txt)
+            candidates = li_candidates + other_candidates
+            # Normalize and filter duplicates
             items: List[Dict[str, Any]] = []
-            for url in urls:
-                try:
-                    resp = requests.get(url, headers=headers, timeout=15)
-                    if resp.status_code != 200 or not resp.text:
-                        continue
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    # Collect list items that look like skills
-                    candidates = []
-                    for li in soup.select("li"):
-                        txt = (li.get_text(" ") or "").strip()
-                        if 1 <= len(txt.split()) <= 4 and 2 <= len(txt) <= 40:  # short skill-like tokens
-                            candidates.append(txt)
-                    # Fallback: headings/spans
-                    for el in soup.select("h2, h3, span, a"):
-                        txt = (el.get_text(" ") or "").strip()
-                        if 1 <= len(txt.split()) <= 3 and 2 <= len(txt) <= 30:
-                            candidates.append(txt)
-                    # Normalize and filter duplicates
-                    seen: Set[str] = set()
-                    for c in candidates:
-                        skill = self._normalize_skill(c)
-                        if not skill or len(skill) > 30:
-                            continue
-                        if any(ch.isdigit() for ch in skill):
-                            continue
-                        if skill in seen:
-                            continue
-                        seen.add(skill)
-                        items.append({
-                            "title": f"Upwork demand skill: {c}",
-                            "skills": [skill],
-                            "rate": None,
-                            "source": "upwork",
-                        })
-                    if items:
-                        break  # stop after first successful page
-                except Exception as e:  # pragma: no cover - network dependent
-                    self.logger.warning("Upwork scrape failed for %s: %s", url, e)
+            seen: Set[str] = set()
+            for c in candidates:
+                skill = _normalize_skill(c)
+                if not skill or len(skill) > 30:
                     continue
+                if any(ch.isdigit() for ch in skill):
+                    continue
+                if skill in seen:
+                    continue
+                seen.add(skill)
+                items.append({
+                    "title": f"Upwork demand skill: {c}",
+                    "skills": [skill],
+                    "rate": None,
+                    "source": "upwork",
+                })
             return items
 
-        return await self._to_thread(_fetch)
+        urls = [
+            "https://www.upwork.com/resources/most-in-demand-tech-skills",
+            "https://www.upwork.com/resources/most-in-demand-skills",
+        ]
+        return await self._scrape_first(client, urls, _parse, "Upwork")
 
     async def scrape_freelancer(self) -> List[Dict[str, Any]]:  # pragma: no cover - network dependent
         """Scrape Freelancer public pages to extract popular skills/categories.
         Returns job-like items with skills only; no auth.
         """
         try:
-            import requests  # type: ignore
             from bs4 import BeautifulSoup  # type: ignore
+            client = _http_client()
         except Exception as e:  # pragma: no cover - environment dependent
             self.logger.warning("Freelancer scraper unavailable (deps missing): %s", e)
             return []
 
-        def _fetch() -> List[Dict[str, Any]]:
-            urls = [
-                "https://www.freelancer.com/jobs/",   # categories and popular skills/keywords
-                "https://www.freelancer.com/job/",    # alt path (redirects)
-            ]
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            }
+        def _parse(content: bytes) -> List[Dict[str, Any]]:
+            soup = BeautifulSoup(content, _html_parser())
+            candidates = []
+            # Common skill/tag containers
+            for a in soup.select("a, span"):
+                txt = (a.get_text(" ") or "").strip()
+                if 1 <= len(txt.split()) <= 3 and 2 <= len(txt) <= 30:
+                    candidates.append(txt)
             items: List[Dict[str, Any]] = []
-            for url in urls:
-                try:
-                    resp = requests.get(url, headers=headers, timeout=15)
-                    if resp.status_code != 200 or not resp.text:
-                        continue
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    candidates = []
-                    # Common skill/tag containers
-                    for a in soup.select("a, span"):
-                        txt = (a.get_text(" ") or "").strip()
-                        if 1 <= len(txt.split()) <= 3 and 2 <= len(txt) <= 30:
-                            candidates.append(txt)
-                    seen: Set[str] = set()
-                    for c in candidates:
-                        skill = self._normalize_skill(c)
-                        if not skill or len(skill) > 30:
-                            continue
-                        if any(ch.isdigit() for ch in skill):
-                            continue
-                        if skill in seen:
-                            continue
-                        seen.add(skill)
-                        items.append({
-                            "title": f"Freelancer category/skill: {c}",
-                            "skills": [skill],
-                            "rate": None,
-                            "source": "freelancer",
-                        })
-                    if items:
-                        break
-                except Exception as e:  # pragma: no cover
-                    self.logger.warning("Freelancer scrape failed for %s: %s", url, e)
+            seen: Set[str] = set()
+            for c in candidates:
+                skill = _normalize_skill(c)
+                if not skill or len(skill) > 30:
                     continue
+                if any(ch.isdigit() for ch in skill):
+                    continue
+                if skill in seen:
+                    continue
+                seen.add(skill)
+                items.append({
+                    "title": f"Freelancer category/skill: {c}",
+                    "skills": [skill],
+                    "rate": None,
+                    "source": "freelancer",
+                })
             return items
 
-        return await self._to_thread(_fetch)
+        urls = [
+            "https://www.freelancer.com/jobs/",   # categories and popular skills/keywords
+            "https://www.freelancer.com/job/",    # alt path (redirects)
+        ]
+        return await self._scrape_first(client, urls, _parse, "Freelancer")
 
     # ------------------------------
     # Basic processing primitives
     # ------------------------------
     async def parse_job_requirements(self, jobs: List[Dict[str, Any]]) -> Dict[str, int]:
-        skills: Dict[str, int] = {}
+        skills: Counter = Counter()
         for job in jobs:
             # explicit skills list
-            for skill in job.get("skills", []) or []:
-                s = self._normalize_skill(skill)
-                if not s:
-                    continue
-                skills[s] = skills.get(s, 0) + 1
+            skills.update(s for s in map(_normalize_skill, job.get("skills", []) or []) if s)
             # try to extract from text fields
             text = " ".join(str(job.get(k, "")) for k in ("title", "description", "tags"))
-            for s in self._extract_skills_from_text(text):
-                skills[s] = skills.get(s, 0) + 1
-        return skills
+            skills.update(self._extract_skills_from_text(text))
+        return dict(skills)
 
     async def calculate_avg_rates(self, jobs: List[Dict[str, Any]]) -> float:
         """Calculate average hourly rate from structured or inferred fields.
         Accepts numeric `rate` or parses from `rate_text`/text fields.
         """
-        vals: List[float] = []
-        for j in jobs:
+        def rate_of(j: Dict[str, Any]) -> Optional[float]:
             rate = j.get("rate")
             if isinstance(rate, (int, float)):
-                vals.append(float(rate))
-                continue
+                return float(rate)
             # parse from text fields
             for key in ("rate_text", "title", "description"):
                 val = self._extract_rate_from_text(j.get(key))
                 if val is not None:
-                    vals.append(val)
-                    break
-        if not vals:
+                    return val
+            return None
+
+        try:
+            # single pass over a generator; no intermediate list of rates
+            return statistics.fmean(v for v in map(rate_of, jobs) if v is not None)
+        except statistics.StatisticsError:  # no rates found
             return 0.0
-        return sum(vals) / len(vals)
 
     # ------------------------------
     # High-level aggregation output
@@ -249,10 +336,10 @@ class FreelanceAnalyzer:
         jobs = (upwork_jobs or []) + (freelancer_jobs or [])
         skills = await self.parse_job_requirements(jobs)
         avg_rate = await self.calculate_avg_rates(jobs)
+        # ties broken by name: skill extraction yields unordered sets
         ranked = sorted(
             ({"technology": k, "mentions": float(v)} for k, v in skills.items()),
-            key=lambda x: x["mentions"],
-            reverse=True,
+            key=lambda x: (-x["mentions"], x["technology"]),
         )
         status = "ok" if ranked else "not_available"
         if ranked and avg_rate == 0.0:
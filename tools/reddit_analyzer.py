@@ -1,8 +1,11 @@
 import asyncio
+import functools
+import re
 import time
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from array import array
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple, Union
 
 try:
     import praw  # type: ignore
@@ -10,6 +13,88 @@ except Exception:  # pragma: no cover
     praw = None  # type: ignore
 
 
+# Sentiment lexicon (+1 / -1 per token)
+_POSITIVE_WORDS = frozenset({"great", "awesome", "love", "fast", "good", "win", "best", "cool"})
+_NEGATIVE_WORDS = frozenset({"bad", "hate", "slow", "bug", "issue", "problem", "worst"})
+# Token -> sentiment id (+1 positive, -1 negative); anything else scores 0
+_SENTIMENT_IDS: Dict[str, int] = {**{w: 1 for w in _POSITIVE_WORDS}, **{w: -1 for w in _NEGATIVE_WORDS}}
+# Tokens are whitespace-separated words with this punctuation stripped from both ends
+TOKEN_STRIP = ".,!?:;()[]{}\"'"
+
+
+@functools.lru_cache(maxsize=128)
+def build_keyword_pattern(keywords: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Compile one alternation matching any of the (lowercase) keywords as a whole token.
+
+    Longer keywords are tried first; lookarounds instead of \\b keep tokens such as
+    "c++" or ".net" matchable. Returns None for an empty keyword set.
+    """
+    kws = sorted({k.strip().lower() for k in keywords if k and k.strip()}, key=len, reverse=True)
+    if not kws:
+        return None
+    return re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, kws)) + r")(?!\w)")
+
+
+@functools.lru_cache(maxsize=128)
+def build_keyword_automaton(keywords: Tuple[str, ...]) -> Optional[Any]:
+    """Aho-Corasick automaton over the (lowercase) keywords; None when the set is
+    empty or pyahocorasick is not installed (callers fall back to build_keyword_pattern()).
+    """
+    try:
+        import ahocorasick  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    kws = {k.strip().lower() for k in keywords if k and k.strip()}
+    if not kws:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in kws:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(ch: str) -> bool:
+    # same character class as the regex \w used by build_keyword_pattern()
+    return ch.isalnum() or ch == "_"
+
+
+def _iter_token_matches(automaton: Any, text: str):
+    """Yield keyword hits in text with build_keyword_pattern() semantics: whole tokens
+    only, leftmost first, the longest keyword at a position wins and hits don't overlap.
+    """
+    n = len(text)
+    spans = []
+    for end, kw in automaton.iter(text):
+        start = end - len(kw) + 1
+        if (start > 0 and _is_word_char(text[start - 1])) or (end + 1 < n and _is_word_char(text[end + 1])):
+            continue
+        spans.append((start, -len(kw), kw))
+    spans.sort()
+    pos = 0
+    for start, neg_len, kw in spans:
+        if start >= pos:
+            yield kw
+            pos = start - neg_len
+
+
+def _iter_post_hits(lowered: List[str], keywords: List[str]) -> Iterator[Tuple[int, Iterable[str]]]:
+    """Yield (post index, keyword hits) over lowercased post texts, using the
+    whole-token semantics of _iter_token_matches()/build_keyword_pattern().
+    """
+    valid = tuple(sorted(k for k in keywords if k and isinstance(k, str)))
+    automaton = build_keyword_automaton(valid)
+    if automaton is not None:
+        for i, text in enumerate(lowered):
+            yield i, _iter_token_matches(automaton, text)
+        return
+    kw_pattern = build_keyword_pattern(valid)
+    if kw_pattern is None:
+        return
+    for i, text in enumerate(lowered):
+        yield i, (m.group(0) for m in kw_pattern.finditer(text))
+
+
 @dataclass
 class RedditPost:
     id: str
@@ -21,11 +106,62 @@ class RedditPost:
     url: str
 
 
+class RedditPostBatch:
+    """Column-oriented (struct-of-arrays) container for fetched posts.
+
+    Text columns are plain lists, numeric columns are contiguous ``array`` buffers
+    (usable via numpy.frombuffer); lower_texts holds the lowercased "title selftext"
+    consumed by the keyword/sentiment scans.
+    """
+
+    __slots__ = ("ids", "titles", "selftexts", "created_utc", "scores", "subreddits", "urls", "lower_texts")
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.titles: List[str] = []
+        self.selftexts: List[str] = []
+        self.created_utc = array("d")
+        self.scores = array("q")
+        self.subreddits: List[str] = []
+        self.urls: List[str] = []
+        self.lower_texts: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, post: RedditPost) -> None:
+        self.ids.append(post.id)
+        self.titles.append(post.title)
+        self.selftexts.append(post.selftext)
+        self.created_utc.append(post.created_utc)
+        self.scores.append(post.score)
+        self.subreddits.append(post.subreddit)
+        self.urls.append(post.url)
+        self.lower_texts.append(f"{post.title} {post.selftext}".lower())
+
+    def as_records(self) -> List[RedditPost]:
+        """Row-oriented RedditPost list for callers that want records."""
+        return [
+            RedditPost(*row)
+            for row in zip(
+                self.ids, self.titles, self.selftexts, self.created_utc, self.scores, self.subreddits, self.urls
+            )
+        ]
+
+
+PostsLike = Union[RedditPostBatch, List[RedditPost]]
+
+
 class RedditAnalyzer:
-    def __init__(self, reddit_client: Optional[Any], logger, cache) -> None:
+    # lifetime of cached per-subreddit post lists (seconds)
+    POSTS_TTL = 1800
+
+    def __init__(self, reddit_client: Optional[Any], logger, cache, max_concurrent: int = 4) -> None:
         self.reddit = reddit_client
         self.logger = logger
         self.cache = cache
+        # caps in-flight listing requests so PRAW's rate limiter isn't driven into back-off
+        self._sem = asyncio.Semaphore(max(1, int(max_concurrent)))
 
     async def _retry(self, func, *args, retries: int = 3, base_delay: float = 0.5, **kwargs):
         last_exc = None
@@ -39,87 +175,139 @@ class RedditAnalyzer:
                 await asyncio.sleep(delay)
         raise last_exc  # type: ignore
 
-    async def fetch_posts(self, subreddits: List[str], lookback_days: int, limit_per_sub: int = 200) -> List[RedditPost]:
+    async def fetch_posts(self, subreddits: List[str], lookback_days: int, limit_per_sub: int = 200) -> RedditPostBatch:
         """Fetch recent posts from given subreddits within the lookback window.
         Uses .new() listing due to search limitations for fresh content.
         """
+        posts = RedditPostBatch()
         if not self.reddit:
             self.logger.warning("Reddit client is not configured. Returning empty post list.")
-            return []
-        threshold = datetime.utcnow() - timedelta(days=lookback_days)
-        posts: List[RedditPost] = []
+            return posts
+        # .new() is newest-first, so the first older post ends the listing (and PRAW paging)
+        threshold = time.time() - lookback_days * 86400
 
-        async def fetch_sub(sub: str):
-            try:
-                subreddit = self.reddit.subreddit(sub)
-                count = 0
-                for submission in subreddit.new(limit=limit_per_sub):
-                    created_dt = datetime.utcfromtimestamp(getattr(submission, "created_utc", time.time()))
-                    if created_dt < threshold:
-                        break
-                    posts.append(
-                        RedditPost(
-                            id=str(submission.id),
-                            title=submission.title or "",
-                            selftext=submission.selftext or "",
-                            created_utc=float(getattr(submission, "created_utc", time.time())),
-                            score=int(getattr(submission, "score", 0)),
-                            subreddit=sub,
-                            url=f"https://reddit.com{submission.permalink}",
-                        )
+        def read_listing(sub: str) -> List[RedditPost]:
+            # blocking PRAW iteration; runs in a worker thread
+            found: List[RedditPost] = []
+            for submission in self.reddit.subreddit(sub).new(limit=limit_per_sub):
+                created = float(getattr(submission, "created_utc", time.time()))
+                if created < threshold:
+                    break
+                found.append(
+                    RedditPost(
+                        id=str(submission.id),
+                        title=submission.title or "",
+                        selftext=submission.selftext or "",
+                        created_utc=created,
+                        score=int(getattr(submission, "score", 0)),
+                        subreddit=sub,
+                        url=f"https://reddit.com{submission.permalink}",
                     )
-                    count += 1
-                self.logger.info("Fetched %s posts from r/%s", count, sub)
+                )
+            return found
+
+        async def fetch_sub(sub: str) -> None:
+            try:
+                async with self._sem:
+                    sub_posts = await asyncio.to_thread(read_listing, sub)
             except Exception as e:  # pragma: no cover - external dependency
                 self.logger.warning("Failed to fetch from r/%s: %s", sub, e)
+                return
+            for post in sub_posts:
+                posts.append(post)
+            self.logger.info("Fetched %s posts from r/%s", len(sub_posts), sub)
+            fetched[sub] = sub_posts
+
+        # per-subreddit post cache; the lookback start is floored to the hour so
+        # re-polls within the same hour share one entry
+        since_hour = int(threshold) // 3600
 
-        await asyncio.gather(*(fetch_sub(s) for s in subreddits))
+        def sub_key(sub: str) -> str:
+            return f"reddit:{sub.lower()}:{since_hour}:{limit_per_sub}"
+
+        # subreddit names are case-insensitive: r/Python and r/python are one listing
+        unique = list({s.lower(): s for s in subreddits}.values())
+        missing: List[str] = []
+        for sub in unique:
+            cached = self.cache.get(sub_key(sub)) if self.cache is not None else None
+            if cached is None:
+                missing.append(sub)
+                continue
+            for d in cached:
+                posts.append(RedditPost(**d))
+        fetched: Dict[str, List[RedditPost]] = {}
+        await asyncio.gather(*(fetch_sub(sub) for sub in missing))
+        if self.cache is not None and fetched:
+            # one batched write (a single pipelined round trip on Redis)
+            self.cache.set_many({
+                sub_key(sub): ([asdict(p) for p in sub_posts], self.POSTS_TTL)
+                for sub, sub_posts in fetched.items()
+            })
         return posts
 
-    async def extract_technologies(self, posts: List[RedditPost], keywords: List[str]) -> Dict[str, int]:
+    @staticmethod
+    def prepare_posts(posts: PostsLike) -> List[str]:
+        """Lowercased "title selftext" per post, built once and shared by the analyzers below."""
+        if isinstance(posts, RedditPostBatch):
+            return posts.lower_texts
+        return [f"{p.title} {p.selftext}".lower() for p in posts]
+
+    async def extract_technologies(
+        self,
+        posts: PostsLike,
+        keywords: List[str],
+        lowered: Optional[List[str]] = None,
+    ) -> Dict[str, int]:
+        """Count whole-token keyword mentions across posts.
+
+        Uses one Aho-Corasick pass per post when pyahocorasick is installed, otherwise
+        one scan with build_keyword_pattern(); either way one scan per post replaces
+        a substring search per keyword.
+        lowered is an optional prepare_posts(posts) result.
+        """
         if not posts:
             return {}
-        counts: Dict[str, int] = {}
-        normalized = [k.strip().lower() for k in keywords if k and isinstance(k, str)]
-        for p in posts:
-            text = f"{p.title} {p.selftext}".lower()
-            for kw in normalized:
-                if kw and kw in text:
-                    counts[kw] = counts.get(kw, 0) + text.count(kw)
-        return counts
-
-    async def calculate_sentiment(self, posts: List[RedditPost], keywords: List[str]) -> Dict[str, Dict[str, float]]:
+        if lowered is None:
+            lowered = self.prepare_posts(posts)
+        counts: Counter = Counter()
+        for _, hits in _iter_post_hits(lowered, keywords):
+            counts.update(hits)
+        return dict(counts)
+
+    async def calculate_sentiment(
+        self,
+        posts: PostsLike,
+        keywords: List[str],
+        lowered: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, float]]:
         """Very simple lexicon-based sentiment by keyword.
         Scores: positive_words +1, negative_words -1, normalized per mention.
+        lowered is an optional prepare_posts(posts) result.
         """
         if not posts:
             return {}
-        positive_words = {"great", "awesome", "love", "fast", "good", "win", "best", "cool"}
-        negative_words = {"bad", "hate", "slow", "bug", "issue", "problem", "worst"}
-        result: Dict[str, Dict[str, float]] = {}
+        if lowered is None:
+            lowered = self.prepare_posts(posts)
         normalized = [k.strip().lower() for k in keywords if k and isinstance(k, str)]
 
+        # posts mentioning each keyword, matched as whole tokens like extract_technologies()
+        mentioned: Dict[str, List[int]] = {}
+        for i, hits in _iter_post_hits(lowered, normalized):
+            for kw in set(hits):
+                mentioned.setdefault(kw, []).append(i)
+
+        # tokenize and score each mentioning post once, independent of the number of
+        # keywords; one dict lookup per token
+        sentiment_id = _SENTIMENT_IDS.get
+        scored = {
+            i: sum(sentiment_id(t.strip(TOKEN_STRIP), 0) for t in lowered[i].split())
+            for i in set().union(*mentioned.values())
+        }
+        result: Dict[str, Dict[str, float]] = {}
         for kw in normalized:
-            total_score = 0
-            mentions = 0
-            for p in posts:
-                text = f"{p.title} {p.selftext}".lower()
-                if kw in text:
-                    # naive tokenization
-                    tokens = [t.strip(".,!?:;()[]{}\"'") for t in text.split()]
-                    score = 0
-                    for t in tokens:
-                        if t in positive_words:
-                            score += 1
-                        elif t in negative_words:
-                            score -= 1
-                    total_score += score
-                    mentions += 1
-            if mentions > 0:
-                result[kw] = {
-                    "avg_sentiment": total_score / max(1, mentions),
-                    "mentions": mentions,
-                }
+            idx = mentioned.get(kw)
+            if idx:
+                result[kw] = {"avg_sentiment": sum(scored[i] for i in idx) / len(idx), "mentions": len(idx)}
         return result
 
     async def rank_by_popularity(self, technologies: Dict[str, int]) -> List[Dict[str, Any]]:
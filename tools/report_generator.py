@@ -1,6 +1,9 @@
 import asyncio
 import json
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -8,6 +11,9 @@ from typing import Any, Dict, List, Optional
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 try:
+    import matplotlib  # type: ignore
+
+    matplotlib.use("Agg")  # headless server: skip GUI backend discovery
     import matplotlib.pyplot as plt  # type: ignore
 except Exception:  # pragma: no cover
     plt = None  # type: ignore
@@ -25,19 +31,93 @@ except Exception:
     Workbook = None  # type: ignore
 
 
+def _write_pdf(items: List[Dict[str, Any]], charts: Dict[str, str], out_path: str) -> None:
+    """Render the PDF report; top-level so it can run in a worker process."""
+    c = canvas.Canvas(out_path, pagesize=A4)
+    width, height = A4
+    c.setTitle("IT Trends Report")
+    c.setFont("Helvetica-Bold", 16)
+    c.drawString(40, height - 40, "IT Trends Report")
+    c.setFont("Helvetica", 10)
+    c.drawString(40, height - 60, f"Generated: {datetime.utcnow().isoformat()}Z")
+
+    y = height - 90
+    c.setFont("Helvetica-Bold", 12)
+    c.drawString(40, y, "Top Technologies:")
+    y -= 20
+    c.setFont("Helvetica", 10)
+    for item in items:
+        line = f"- {item.get('technology')}: {item.get('mentions', 0)} mentions"
+        c.drawString(50, y, line)
+        y -= 14
+        if y < 100:
+            c.showPage()
+            y = height - 40
+    # embed chart if present
+    if "top_mentions" in charts:
+        try:
+            c.showPage()
+            c.drawImage(charts["top_mentions"], 40, 150, width=width - 80, preserveAspectRatio=True, mask='auto')
+        except Exception:
+            pass
+    c.showPage()
+    c.save()
+
+
+def _write_excel(items: List[Dict[str, Any]], out_path: str) -> None:
+    """Build and save the Excel workbook; top-level so it can run in a worker process."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Top Technologies"
+    ws.append(["Technology", "Mentions"])
+    for item in items:
+        ws.append([item.get("technology"), item.get("mentions", 0)])
+    wb.save(out_path)
+
+
+def _worker_context() -> multiprocessing.context.BaseContext:
+    """Start method for the render workers: forkserver where available, else spawn.
+
+    Forking the server itself would copy its I/O threads' held locks into the child.
+    Both methods re-import the launching script as __mp_main__ in each worker, so
+    the worker entry points (_write_pdf/_write_excel) live here, not in server.py.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
 class ReportGenerator:
     def __init__(self, output_dir: str, templates_dir: str, logger) -> None:
         self.output_dir = Path(output_dir)
         self.templates_dir = Path(templates_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # templates are compiled once and never re-checked on disk
         self.env = Environment(
             loader=FileSystemLoader(str(self.templates_dir)),
             autoescape=select_autoescape(["html", "xml"]),
+            auto_reload=False,
+            cache_size=400,
         )
         self.logger = logger
+        # reportlab/openpyxl rendering is CPU-bound pure Python; it runs in worker
+        # processes so it doesn't hold the GIL against the I/O threads. Created on first use.
+        self._proc_pool: Optional[ProcessPoolExecutor] = None
+        # chart figure, created on first use and cleared/reused for every chart
+        self._fig = None
+        self._ax = None
 
-    def _normalize_top_technologies(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Return a normalized list of {technology, mentions}.
+    async def _run_in_process(self, func, *args) -> None:
+        if self._proc_pool is None:
+            self._proc_pool = ProcessPoolExecutor(max_workers=2, mp_context=_worker_context())
+        try:
+            await asyncio.get_running_loop().run_in_executor(self._proc_pool, func, *args)
+        except BrokenProcessPool as e:  # pragma: no cover - worker crashed or can't start
+            self.logger.warning("Report worker pool unavailable (%s); rendering in a thread", e)
+            self._proc_pool = None
+            await asyncio.to_thread(func, *args)
+
+    def _normalize_top_technologies(self, data: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return a normalized list of {technology, mentions}, at most limit entries when given.
 
         Accepts either:
         - data["top_technologies"]: list of dicts with keys technology, mentions
@@ -49,6 +129,8 @@ class ReportGenerator:
             if isinstance(raw, list) and raw:
                 # Already in the expected format
                 for it in raw:
+                    if limit is not None and len(items) >= limit:
+                        break
                     tech = str((it or {}).get("technology") or "").strip()
                     if tech:
                         items.append({
@@ -62,6 +144,8 @@ class ReportGenerator:
             if isinstance(trends, list) and trends:
                 n = len(trends)
                 for idx, name in enumerate(trends):
+                    if limit is not None and len(items) >= limit:
+                        break
                     tech = str(name or "").strip()
                     if tech:
                         # Assign a simple descending score so charts look meaningful
@@ -79,20 +163,23 @@ class ReportGenerator:
                 self.logger.warning("matplotlib not available; skipping charts")
                 return charts
             # Example chart: top technologies by mentions
-            techs = self._normalize_top_technologies(data)
+            techs = self._normalize_top_technologies(data, limit=15)
             if not techs:
                 return charts
-            names = [t.get("technology") for t in techs[:15]]
-            values = [t.get("mentions", 0) for t in techs[:15]]
-            fig, ax = plt.subplots(figsize=(10, 6))
+            names = [t.get("technology") for t in techs]
+            values = [t.get("mentions", 0) for t in techs]
+            if self._fig is None:
+                self._fig, self._ax = plt.subplots(figsize=(10, 6))
+            fig, ax = self._fig, self._ax
+            ax.clear()
             ax.bar(names, values, color="#4C78A8")
             ax.set_title("Top technologies by mentions")
             ax.set_ylabel("Mentions")
+            ax.set_xticks(range(len(names)))
             ax.set_xticklabels(names, rotation=45, ha="right")
             fig.tight_layout()
             out_path = self.output_dir / f"chart_top_mentions_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.png"
-            fig.savefig(out_path, dpi=150)
-            plt.close(fig)
+            fig.savefig(out_path, dpi=100)
             charts["top_mentions"] = str(out_path)
         except Exception as e:  # pragma: no cover
             self.logger.warning("Failed to create charts: %s", e)
@@ -103,54 +190,17 @@ class ReportGenerator:
             self.logger.warning("reportlab not available; falling back to HTML")
             return await self.generate_html(data, charts)
         out_path = self.output_dir / f"report_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.pdf"
-        await asyncio.to_thread(self._write_pdf, data, charts or {}, out_path)
+        items = self._normalize_top_technologies(data, limit=25)
+        await self._run_in_process(_write_pdf, items, charts or {}, str(out_path))
         return str(out_path)
 
-    def _write_pdf(self, data: Dict[str, Any], charts: Dict[str, str], out_path: Path) -> None:
-        c = canvas.Canvas(str(out_path), pagesize=A4)
-        width, height = A4
-        c.setTitle("IT Trends Report")
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(40, height - 40, "IT Trends Report")
-        c.setFont("Helvetica", 10)
-        c.drawString(40, height - 60, f"Generated: {datetime.utcnow().isoformat()}Z")
-
-        y = height - 90
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(40, y, "Top Technologies:")
-        y -= 20
-        c.setFont("Helvetica", 10)
-        items = self._normalize_top_technologies(data)[:25]
-        for item in items:
-            line = f"- {item.get('technology')}: {item.get('mentions', 0)} mentions"
-            c.drawString(50, y, line)
-            y -= 14
-            if y < 100:
-                c.showPage()
-                y = height - 40
-        # embed chart if present
-        if "top_mentions" in charts:
-            try:
-                c.showPage()
-                c.drawImage(charts["top_mentions"], 40, 150, width=width - 80, preserveAspectRatio=True, mask='auto')
-            except Exception:
-                pass
-        c.showPage()
-        c.save()
-
     async def generate_excel(self, data: Dict[str, Any]) -> str:
         if Workbook is None:
             self.logger.warning("openpyxl not available; falling back to HTML")
             return await self.generate_html(data, charts=None)
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Top Technologies"
-        ws.append(["Technology", "Mentions"])
         items = self._normalize_top_technologies(data)
-        for item in items:
-            ws.append([item.get("technology"), item.get("mentions", 0)])
         out_path = self.output_dir / f"report_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        await asyncio.to_thread(wb.save, str(out_path))
+        await self._run_in_process(_write_excel, items, str(out_path))
         return str(out_path)
 
     async def generate_html(self, data: Dict[str, Any], charts: Optional[Dict[str, str]] = None) -> str:
@@ -160,12 +210,13 @@ class ReportGenerator:
         data_to_render = dict(data)
         if items and not data_to_render.get("top_technologies"):
             data_to_render["top_technologies"] = items
-        html = template.render(
+        # rendered chunk by chunk straight into the file instead of one big string
+        stream = template.stream(
             generated_at=datetime.utcnow().isoformat() + "Z",
             data=data_to_render,
             charts=charts or {},
             title="IT Trends Report",
         )
         out_path = self.output_dir / f"report_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.html"
-        await asyncio.to_thread(out_path.write_text, html, "utf-8")
+        await asyncio.to_thread(stream.dump, str(out_path), "utf-8")
         return str(out_path)
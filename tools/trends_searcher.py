@@ -1,5 +1,45 @@
 import asyncio
-from typing import Any, Dict, List, Optional
+import functools
+import heapq
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# requests.Session is not thread-safe; each to_thread worker keeps its own
+_SESSIONS = threading.local()
+
+
+def _http_session() -> Any:
+    """Per-thread requests.Session so repeated searches reuse pooled keep-alive connections."""
+    session = getattr(_SESSIONS, "session", None)
+    if session is None:
+        import requests  # type: ignore
+
+        session = _SESSIONS.session = requests.Session()
+    return session
+
+
+def _has_class_xpath(tag: str, cls: str) -> str:
+    # XPath equivalent of the CSS selector tag.cls
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+
+
+@functools.lru_cache(maxsize=None)
+def _github_xpaths() -> Optional[Tuple[Any, Any, Any, Any]]:
+    """(fromstring, articles, language, topics) for parsing GitHub Trending with lxml;
+    the XPath expressions are compiled once. None if lxml is not installed.
+    """
+    try:
+        from lxml import etree, html as lxml_html  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return (
+        lxml_html.fromstring,
+        etree.XPath(_has_class_xpath("article", "Box-row")),
+        etree.XPath(".//span[@itemprop='programmingLanguage']"),
+        etree.XPath(_has_class_xpath("a", "topic-tag")),
+    )
 
 
 class TrendsSearcher:
@@ -82,11 +122,13 @@ class TrendsSearcher:
 
         Returns technologies as languages and repository topics, ranked by frequency.
         """
+        xpaths = _github_xpaths()
         try:
-            import requests  # type: ignore
-            from bs4 import BeautifulSoup  # type: ignore
+            session = _http_session()
+            if xpaths is None:
+                from bs4 import BeautifulSoup  # type: ignore
         except Exception as e:  # pragma: no cover - environment dependent
-            self.logger.warning("requests/bs4 not available: %s", e)
+            self.logger.warning("requests/lxml/bs4 not available: %s", e)
             return {"source": "github_trending", "top_technologies": [], "status": "not_available"}
 
         def _fetch() -> Dict[str, int]:
@@ -95,10 +137,26 @@ class TrendsSearcher:
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             }
-            counts: Dict[str, int] = {}
+            counts: Counter = Counter()
             try:
-                resp = requests.get(url, headers=headers, timeout=15)
+                resp = session.get(url, headers=headers, timeout=15)
                 resp.raise_for_status()
+                if xpaths is not None:
+                    fromstring, articles_xp, lang_xp, topics_xp = xpaths
+                    # Each repo entry
+                    for article in articles_xp(fromstring(resp.content)):
+                        # language (first match, as select_one below)
+                        langs = lang_xp(article)
+                        if langs:
+                            tech = self._normalize_tech(langs[0].text_content())
+                            if tech:
+                                counts[tech] += 1
+                        # topics
+                        for t in topics_xp(article):
+                            tech = self._normalize_tech(t.text_content())
+                            if tech:
+                                counts[tech] += 1
+                    return counts
                 soup = BeautifulSoup(resp.text, "html.parser")
                 # Each repo entry
                 for article in soup.select("article.Box-row"):
@@ -107,12 +165,12 @@ class TrendsSearcher:
                     if lang_el and lang_el.text:
                         tech = self._normalize_tech(lang_el.text)
                         if tech:
-                            counts[tech] = counts.get(tech, 0) + 1
+                            counts[tech] += 1
                     # topics
                     for t in article.select("a.topic-tag"):
                         tech = self._normalize_tech(t.text)
                         if tech:
-                            counts[tech] = counts.get(tech, 0) + 1
+                            counts[tech] += 1
             except Exception as inner:  # pragma: no cover
                 self.logger.warning("GitHub Trending fetch failed: %s", inner)
             return counts
@@ -134,7 +192,7 @@ class TrendsSearcher:
         Uses /tags?sort=popular as a lightweight signal. Mentions = tag usage count.
         """
         try:
-            import requests  # type: ignore
+            session = _http_session()
         except Exception as e:  # pragma: no cover
             self.logger.warning("requests not available: %s", e)
             return {"source": "stackoverflow", "top_technologies": [], "status": "not_available"}
@@ -147,16 +205,16 @@ class TrendsSearcher:
                 "site": "stackoverflow",
                 "pagesize": 100,
             }
-            counts: Dict[str, int] = {}
+            counts: Counter = Counter()
             try:
-                resp = requests.get(base, params=params, timeout=20)
+                resp = session.get(base, params=params, timeout=20)
                 resp.raise_for_status()
                 payload = resp.json() or {}
                 for item in payload.get("items", []):
                     tag = self._normalize_tech(item.get("name"))
                     count = int(item.get("count", 0) or 0)
                     if tag:
-                        counts[tag] = counts.get(tag, 0) + count
+                        counts[tag] += count
             except Exception as inner:  # pragma: no cover
                 self.logger.warning("StackOverflow tags fetch failed: %s", inner)
             return counts
@@ -170,15 +228,17 @@ class TrendsSearcher:
         return {"source": "stackoverflow", "top_technologies": ranked, "status": "ok"}
 
     # - aggregate_results() - агрегация результатов из всех источников
-    async def aggregate_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
-        agg: Dict[str, float] = {}
+    async def aggregate_results(self, results: List[Dict[str, Any]], top_k: Optional[int] = None) -> Dict[str, Any]:
+        """Sum mentions per technology across sources, ranked descending.
+        With top_k only the k largest are kept (heap selection instead of a full sort).
+        """
+        agg: Dict[str, float] = defaultdict(float)
         for r in results:
             for item in r.get("top_technologies", []):
                 tech = (item.get("technology") or "").strip().lower()
-                agg[tech] = agg.get(tech, 0.0) + float(item.get("mentions", 0))
-        ranked = sorted(
-            ({"technology": k, "mentions": v} for k, v in agg.items()),
-            key=lambda x: x["mentions"],
-            reverse=True,
-        )
-        return {"top_technologies": ranked}
+                agg[tech] += float(item.get("mentions", 0))
+        if top_k is not None:
+            top = heapq.nlargest(top_k, agg.items(), key=lambda kv: kv[1])
+        else:
+            top = sorted(agg.items(), key=lambda kv: kv[1], reverse=True)
+        return {"top_technologies": [{"technology": k, "mentions": v} for k, v in top]}
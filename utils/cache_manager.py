@@ -1,16 +1,63 @@
 import asyncio
-import glob
+import fnmatch
 import json
+import logging
 import os
+import re
+import shutil
+import struct
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
 try:
     import redis  # type: ignore
 except Exception:  # pragma: no cover
     redis = None  # type: ignore
 
+try:
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+try:
+    import msgspec  # type: ignore
+except Exception:  # pragma: no cover
+    msgspec = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# JSON codec for plain (non-msgpack) bodies and legacy entries: orjson when installed
+_json_loads: Callable[[Any], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        # non-str keys are stringified, as json.dumps does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
+
+
+# child of the server logger, so messages share its handlers
+logger = logging.getLogger("it-trends-mcp-server.cache")
+
+# Cache entries are framed as: flags (1 byte) + body length (4 bytes, big-endian) + body.
+# The length makes truncated/partial writes detectable; flags describe the body encoding.
+# Entries starting with "{" are legacy plain-JSON values and are still accepted (files
+# keep their .json name either way, so existing entries stay readable and invalidatable).
+_FRAME_HEADER = struct.Struct(">BI")
+_FLAG_ZSTD = 0x01
+_FLAG_MSGPACK = 0x02
+# Bodies larger than this are zstd-compressed
+COMPRESS_THRESHOLD = 4096
+# Entries kept in the in-process LRU in front of the file/Redis backend
+MEM_CACHE_SIZE = 1024
+
 
 class CacheManager:
     def __init__(self, config: dict, default_dir: Optional[str] = None) -> None:
@@ -21,9 +68,17 @@ class CacheManager:
         self.dir = Path(default_dir or ".cache")
         self.dir.mkdir(parents=True, exist_ok=True)
         self._redis = None
+        # in-flight fetches per key, so concurrent misses share a single fetch
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # in-process LRU: key -> (expires_at, value, file mtime_ns or None for Redis).
+        # File entries are revalidated with a stat() so writes by other processes are seen.
+        # Values are shared between callers; treat them as read-only.
+        self._mem: "OrderedDict[str, Tuple[float, Any, Optional[int]]]" = OrderedDict()
+        self._mem_cap = MEM_CACHE_SIZE
+        self._mem_lock = threading.Lock()
         if self.storage == "redis" and redis is not None and self.redis_url:
             try:
-                self._redis = redis.from_url(self.redis_url, decode_responses=True)
+                self._redis = redis.from_url(self.redis_url, decode_responses=False)
             except Exception:
                 self._redis = None
 
@@ -31,53 +86,189 @@ class CacheManager:
         safe = key.replace("/", "_").replace(":", "_")
         return self.dir / f"{safe}.json"
 
+    @staticmethod
+    def _encode(payload: dict) -> bytes:
+        if msgspec is not None:
+            flags, body = _FLAG_MSGPACK, msgspec.msgpack.encode(payload)
+        else:
+            flags, body = 0, _json_dumps(payload)
+        if zstandard is not None and len(body) > COMPRESS_THRESHOLD:
+            flags, body = flags | _FLAG_ZSTD, zstandard.ZstdCompressor(level=3).compress(body)
+        return _FRAME_HEADER.pack(flags, len(body)) + body
+
+    @staticmethod
+    def _decode(raw: bytes) -> Any:
+        if raw[:1] == b"{":
+            return _json_loads(raw)
+        flags, length = _FRAME_HEADER.unpack_from(raw)
+        body = raw[_FRAME_HEADER.size:]
+        if len(body) != length:
+            raise ValueError("truncated cache entry")
+        if flags & _FLAG_ZSTD:
+            if zstandard is None:
+                raise ValueError("zstd-compressed cache entry but zstandard is not installed")
+            body = zstandard.ZstdDecompressor().decompress(body)
+        if flags & _FLAG_MSGPACK:
+            if msgspec is None:
+                raise ValueError("msgpack cache entry but msgspec is not installed")
+            return msgspec.msgpack.decode(body)
+        return _json_loads(body)
+
+    def _mem_get(self, key: str, mtime_ns: Optional[int]) -> Tuple[bool, Any]:
+        with self._mem_lock:
+            entry = self._mem.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value, stored_mtime = entry
+            if (expires_at and expires_at < time.time()) or stored_mtime != mtime_ns:
+                del self._mem[key]
+                return False, None
+            self._mem.move_to_end(key)
+            return True, value
+
+    def _mem_put(self, key: str, expires_at: float, value: Any, mtime_ns: Optional[int]) -> None:
+        with self._mem_lock:
+            self._mem[key] = (expires_at, value, mtime_ns)
+            self._mem.move_to_end(key)
+            while len(self._mem) > self._mem_cap:
+                self._mem.popitem(last=False)
+
     def get(self, key: str) -> Any:
         if not self.enabled:
             return None
         if self._redis is not None:
+            hit, value = self._mem_get(key, None)
+            if hit:
+                return value
             try:
                 raw = self._redis.get(key)
                 if raw is None:
                     return None
-                obj = json.loads(raw)
+                obj = self._decode(raw)
                 if obj.get("expires_at") and obj["expires_at"] < time.time():
                     return None
+                self._mem_put(key, obj.get("expires_at") or 0, obj.get("value"), None)
                 return obj.get("value")
             except Exception:  # pragma: no cover
                 return None
         # file-based
         path = self._file_path(key)
-        if not path.exists():
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
             return None
+        hit, value = self._mem_get(key, mtime_ns)
+        if hit:
+            return value
         try:
-            data = json.loads(path.read_text("utf-8"))
+            data = self._decode(path.read_bytes())
             if data.get("expires_at") and data["expires_at"] < time.time():
                 return None
+            self._mem_put(key, data.get("expires_at") or 0, data.get("value"), mtime_ns)
             return data.get("value")
         except Exception:
             return None
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, alias_keys: Optional[Iterable[str]] = None) -> None:
+        """Store value under key (and any alias_keys), serializing it only once."""
         if not self.enabled:
             return
         ttl_use = int(ttl or self.ttl_default)
         expires_at = int(time.time() + ttl_use)
-        payload = {"value": value, "expires_at": expires_at}
+        try:
+            serialized = self._encode({"value": value, "expires_at": expires_at})
+        except Exception as e:
+            # an unencodable value is simply not cached; callers still get it
+            logger.debug("Skipping cache write for %s: %s", key, e)
+            return
+        for k in (key, *(alias_keys or ())):
+            self._write(k, serialized, ttl_use, expires_at, value)
+
+    def set_many(self, items: Dict[str, Tuple[Any, Optional[int]]]) -> None:
+        """Store several {key: (value, ttl)} entries; on Redis in one pipelined round trip."""
+        if not self.enabled or not items:
+            return
+        now = time.time()
+        entries = []
+        for key, (value, ttl) in items.items():
+            ttl_use = int(ttl or self.ttl_default)
+            expires_at = int(now + ttl_use)
+            try:
+                serialized = self._encode({"value": value, "expires_at": expires_at})
+            except Exception as e:
+                logger.debug("Skipping cache write for %s: %s", key, e)
+                continue
+            entries.append((key, serialized, ttl_use, expires_at, value))
+        if self._redis is not None:
+            try:
+                pipe = self._redis.pipeline(transaction=False)
+                for key, serialized, ttl_use, _, _ in entries:
+                    pipe.set(key, serialized, ex=ttl_use)
+                pipe.execute()
+                for key, _, _, expires_at, value in entries:
+                    self._mem_put(key, expires_at, value, None)
+                return
+            except Exception:  # pragma: no cover
+                pass
+        for entry in entries:
+            self._write(*entry)
+
+    def _write(self, key: str, serialized: bytes, ttl: int, expires_at: float, value: Any) -> None:
         if self._redis is not None:
             try:
-                self._redis.set(key, json.dumps(payload), ex=ttl_use)
+                self._redis.set(key, serialized, ex=ttl)
+                self._mem_put(key, expires_at, value, None)
                 return
             except Exception:  # pragma: no cover
                 pass
         path = self._file_path(key)
         try:
-            path.write_text(json.dumps(payload), encoding="utf-8")
+            path.write_bytes(serialized)
+            self._mem_put(key, expires_at, value, os.stat(path).st_mtime_ns)
         except Exception:
-            pass
+            with self._mem_lock:
+                self._mem.pop(key, None)
+
+    def alias(self, key: str, alias_keys: Iterable[str]) -> None:
+        """Point alias_keys at key's current entry without re-serializing it: a
+        server-side COPY on Redis, a hard link (or byte copy) for files."""
+        if not self.enabled:
+            return
+        alias_keys = [k for k in alias_keys if k != key]
+        with self._mem_lock:
+            for k in alias_keys:
+                self._mem.pop(k, None)
+        if self._redis is not None:
+            try:
+                for k in alias_keys:
+                    self._redis.copy(key, k, replace=True)
+                return
+            except Exception:  # pragma: no cover
+                pass
+        src = self._file_path(key)
+        for k in alias_keys:
+            dst = self._file_path(k)
+            tmp = dst.with_name(f"{dst.name}.{threading.get_ident()}.tmp")
+            try:
+                if dst.exists() and os.path.samefile(src, dst):
+                    continue
+                try:
+                    os.link(src, tmp)
+                except OSError:
+                    shutil.copyfile(src, tmp)
+                os.replace(tmp, dst)
+            except OSError:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
 
     def invalidate(self, pattern: str) -> int:
         """Invalidate keys matching pattern. Returns number of invalidated entries."""
         count = 0
+        with self._mem_lock:
+            for k in [k for k in self._mem if fnmatch.fnmatchcase(k, pattern)]:
+                del self._mem[k]
         if self._redis is not None:
             try:
                 # Use scan to avoid blocking
@@ -91,13 +282,22 @@ class CacheManager:
                         break
             except Exception:  # pragma: no cover
                 pass
-        # file-based
-        for file in glob.glob(str(self.dir / f"{pattern.replace('*', '*')}.json")):
-            try:
-                os.remove(file)
-                count += 1
-            except Exception:
-                pass
+        # file-based: one directory pass, names matched against the pattern mapped
+        # the same way _file_path() maps keys to file names
+        safe = pattern.replace("/", "_").replace(":", "_")
+        match = re.compile(fnmatch.translate(f"{safe}.json")).match
+        try:
+            with os.scandir(self.dir) as entries:
+                for entry in entries:
+                    if not match(entry.name):
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                        count += 1
+                    except Exception:
+                        pass
+        except OSError:
+            pass
         return count
 
     def get_or_fetch(self, key: str, fetch_func: Callable[[], Any], ttl: Optional[int] = None) -> Any:
@@ -108,10 +308,48 @@ class CacheManager:
         self.set(key, value, ttl=ttl)
         return value
 
-    async def get_or_fetch_async(self, key: str, fetch_coro: Callable[[], Any], ttl: Optional[int] = None) -> Any:
-        cached = self.get(key)
-        if cached is not None:
-            return cached
-        value = await fetch_coro()
-        self.set(key, value, ttl=ttl)
+    async def get_or_fetch_async(
+        self,
+        key: str,
+        fetch_coro: Callable[[], Any],
+        ttl: Optional[int] = None,
+        alias_keys: Optional[Iterable[str]] = None,
+    ) -> Any:
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                if alias_keys:
+                    # aliases follow the most recently requested entry, not just the last fetch
+                    self.alias(key, alias_keys)
+                return cached
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                # shield: a cancelled waiter must not cancel the fetch shared with others
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Task.cancelling() is 3.11+; on older Pythons assume we were cancelled
+                cancelling = getattr(asyncio.current_task(), "cancelling", lambda: 1)
+                if not inflight.cancelled() or cancelling():
+                    raise
+                # the leading caller was cancelled, not us: take over the fetch
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            value = await fetch_coro()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved; waiters (if any) still receive it
+            raise
+        else:
+            # resolve waiters before the cache write so they never hang on it
+            fut.set_result(value)
+        finally:
+            self._inflight.pop(key, None)
+        self.set(key, value, ttl=ttl, alias_keys=alias_keys)
         return value
@@ -1,5 +1,18 @@
-from math import sqrt
-from typing import Any, Dict, List, Tuple
+import heapq
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Aliases mapped to canonical technology names
+_NAME_MAP: Dict[str, str] = {
+    "js": "javascript",
+    "nodejs": "node.js",
+    "rb": "ruby",
+    "py": "python",
+    "ts": "typescript",
+}
+# Punctuation removed by normalize_batch(); "." "+" "#" are part of names (node.js, c++, c#)
+_PUNCT_DELETE = str.maketrans("", "", "!\"'(),:;?[]{}")
 
 
 class DataProcessor:
@@ -9,18 +22,17 @@ class DataProcessor:
 
     # - normalize_technology_names() - нормализация названий технологий
     def normalize_technology_names(self, names: List[str]) -> List[str]:
-        mapping = {
-            "js": "javascript",
-            "nodejs": "node.js",
-            "rb": "ruby",
-            "py": "python",
-            "ts": "typescript",
-        }
-        out: List[str] = []
-        for n in names:
-            key = (n or "").strip().lower()
-            out.append(mapping.get(key, key))
-        return out
+        get = _NAME_MAP.get
+        keys = (n.strip().lower() if n else "" for n in names)
+        return [get(k, k) for k in keys]
+
+    def normalize_batch(self, names: List[str]) -> List[str]:
+        """Like normalize_technology_names(), but first deletes punctuation such as
+        quotes and brackets in one str.translate call per name ("." "+" "#" are kept).
+        """
+        get = _NAME_MAP.get
+        keys = (n.translate(_PUNCT_DELETE).strip().lower() if n else "" for n in names)
+        return [get(k, k) for k in keys]
 
     # - calculate_growth_rate() - расчет темпа роста
     def calculate_growth_rate(self, series: List[Tuple[str, float]]) -> float:
@@ -37,19 +49,26 @@ class DataProcessor:
 
     # - detect_anomalies() - обнаружение аномалий в данных
     def detect_anomalies(self, values: List[float], z_thresh: float = 3.0) -> List[int]:
-        if not values:
+        """Indices of values whose z-score (sample std, ddof=1) is at least z_thresh."""
+        if len(values) < 2:
             return []
-        mean = sum(values) / len(values)
-        var = sum((v - mean) ** 2 for v in values) / max(1, len(values) - 1)
-        std = sqrt(var)
+        import numpy as np  # deferred: keeps numpy off the server startup path
+
+        a = np.asarray(values, dtype=np.float64)
+        std = a.std(ddof=1)
         if std == 0:
             return []
-        anomalies = [i for i, v in enumerate(values) if abs(v - mean) / std >= z_thresh]
-        return anomalies
+        return np.flatnonzero(np.abs(a - a.mean()) / std >= z_thresh).tolist()
 
     # - aggregate_multi_source() - объединение данных из разных источников
-    def aggregate_multi_source(self, sources: List[Dict[str, Any]], weights: Dict[str, float] | None = None) -> Dict[str, Any]:
-        agg_counts: Dict[str, float] = {}
+    def aggregate_multi_source(
+        self,
+        sources: List[Dict[str, Any]],
+        weights: Dict[str, float] | None = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Weighted sum of mentions per technology, ranked descending (only the top_k when given)."""
+        agg_counts: Dict[str, float] = defaultdict(float)
         weights = weights or {}
         for src in sources:
             items = src.get("top_technologies", [])
@@ -58,13 +77,12 @@ class DataProcessor:
             for it in items:
                 tech = (it.get("technology") or "").strip().lower()
                 m = float(it.get("mentions", 0)) * w
-                agg_counts[tech] = agg_counts.get(tech, 0.0) + m
-        ranked = sorted(
-            ({"technology": k, "mentions": v} for k, v in agg_counts.items()),
-            key=lambda x: x["mentions"],
-            reverse=True,
-        )
-        return {"top_technologies": ranked}
+                agg_counts[tech] += m
+        if top_k is not None:
+            top = heapq.nlargest(top_k, agg_counts.items(), key=lambda kv: kv[1])
+        else:
+            top = sorted(agg_counts.items(), key=lambda kv: kv[1], reverse=True)
+        return {"top_technologies": [{"technology": k, "mentions": v} for k, v in top]}
 
     # - apply_weights() - применение весов к разным источникам
     def apply_weights(self, data: Dict[str, Any], weights: Dict[str, float]) -> Dict[str, Any]: